@@ -4,19 +4,30 @@
 Exemplos:
     python3 main.py --input video.mp4 --logo logo.png
     python3 main.py --gui
+    python3 main.py --gui-minimal
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import functools
 import json
+import multiprocessing
+import os
+import queue
 import re
 import shutil
+import stat
 import subprocess
 import sys
-import tkinter as tk
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from tkinter import filedialog, messagebox
+from typing import Callable, Iterator
 
 
 ZOOM_FACTOR = 1.10
@@ -24,6 +35,30 @@ WATERMARK_WIDTH_RATIO = 0.12
 PADDING_PX = 20
 SUPPORTED_VIDEO_EXTENSIONS = {".mp4"}
 SUPPORTED_IMAGE_EXTENSIONS = {".png"}
+PROBE_CACHE_VERSION = 3
+FFMPEG_PROBE_OUTPUT_LIMIT = 4096
+FFMPEG_PIPE_BUFFER_SIZE = 1 << 20
+VIDEO_ENCODER_ARGS = {
+    "h264_videotoolbox": ["-q:v", "65", "-pix_fmt", "yuv420p"],
+    "h264_nvenc": ["-cq", "23", "-b:v", "0", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-global_quality", "23", "-pix_fmt", "nv12"],
+    "libx264": ["-preset", "veryfast", "-crf", "23", "-pix_fmt", "yuv420p"],
+}
+MAX_HARDWARE_ENCODER_JOBS = 2
+BATCH_ERROR_TAIL_LINES = 5
+HARDWARE_ENCODER_PREFERENCE = {
+    "darwin": ("h264_videotoolbox",),
+    "default": ("h264_nvenc", "h264_qsv"),
+}
+
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_AUDIO_STREAM_RE = re.compile(r"Stream #\d+:\d+.*Audio:")
+_PROGRESS_LINE_RE = re.compile(r"^(\w+)=(\S*)$")
+_VIDEO_SIZE_RE = re.compile(r"Stream #\d+:\d+.*Video:.*?\b(\d{2,5})x(\d{2,5})\b")
+_ROTATION_RE = re.compile(r"(?:rotation of|rotate\s*:)\s*(-?\d+(?:\.\d+)?)")
+
+_probe_cache: dict[str, list] | None = None
+_batch_logo_pixels: tuple[bytes, int, int] | None = None
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,14 +75,43 @@ def parse_args() -> argparse.Namespace:
         default="edited_video.mp4",
         help="Nome/caminho do vídeo editado (padrão: edited_video.mp4)",
     )
+    parser.add_argument(
+        "--input-dir",
+        help="Processa todos os vídeos .mp4 desta pasta (gera <nome>_edited.mp4 ao lado de cada um).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Número de vídeos processados em paralelo com --input-dir (padrão: metade dos núcleos).",
+    )
+    parser.add_argument(
+        "--threads-per-job",
+        type=int,
+        help="Threads do ffmpeg por vídeo com --input-dir (padrão: núcleos / jobs).",
+    )
+    parser.add_argument(
+        "--pin-cores",
+        action="store_true",
+        help="Fixa cada job de --input-dir a um conjunto próprio de núcleos (apenas Linux).",
+    )
     parser.add_argument(
         "--gui",
         action="store_true",
         help="Abre interface gráfica para selecionar vídeo/logo/saída.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--gui-minimal",
+        action="store_true",
+        help="Seleciona vídeo/logo/saída apenas com as caixas de diálogo nativas, sem formulário.",
+    )
+    args = parser.parse_args()
+    if args.threads_per_job is not None and args.threads_per_job < 1:
+        parser.error("--threads-per-job deve ser maior ou igual a 1")
+    return args
 
 
+@functools.cache
 def resolve_ffmpeg_binary() -> str:
     ffmpeg_in_path = shutil.which("ffmpeg")
     if ffmpeg_in_path:
@@ -64,43 +128,105 @@ def resolve_ffmpeg_binary() -> str:
         )
 
 
-def validate_input_file(path: Path, valid_extensions: set[str], label: str) -> None:
-    if not path.exists():
-        raise FileNotFoundError(f"{label} não encontrado: {path}")
-    if not path.is_file():
+def validate_input_file(path: Path, valid_extensions: set[str], label: str) -> os.stat_result:
+    try:
+        path_stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{label} não encontrado: {path}") from None
+    if not stat.S_ISREG(path_stat.st_mode):
         raise ValueError(f"{label} inválido (não é ficheiro): {path}")
     if path.suffix.lower() not in valid_extensions:
         allowed = ", ".join(sorted(valid_extensions))
         raise ValueError(f"{label} deve ter uma destas extensões: {allowed}")
+    return path_stat
 
 
-def has_audio_stream(video_path: Path, ffmpeg_binary: str) -> bool:
-    cmd = [ffmpeg_binary, "-i", str(video_path)]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    combined_output = f"{result.stdout}\n{result.stderr}"
-    return re.search(r"Stream #\d+:\d+.*Audio:", combined_output) is not None
-
-
+@functools.cache
 def resolve_ffprobe_binary(ffmpeg_binary: str) -> str | None:
     ffprobe_in_path = shutil.which("ffprobe")
     if ffprobe_in_path:
         return ffprobe_in_path
 
     ffmpeg_path = Path(ffmpeg_binary)
-    sibling_ffprobe = ffmpeg_path.with_name("ffprobe")
-    if sibling_ffprobe.exists():
-        return str(sibling_ffprobe)
-
+    candidates = ["ffprobe"]
     if ffmpeg_path.suffix:
-        sibling_ffprobe_with_suffix = ffmpeg_path.with_name(f"ffprobe{ffmpeg_path.suffix}")
-        if sibling_ffprobe_with_suffix.exists():
-            return str(sibling_ffprobe_with_suffix)
+        candidates.append(f"ffprobe{ffmpeg_path.suffix}")
+
+    try:
+        with os.scandir(ffmpeg_path.parent) as entries:
+            siblings = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.name.startswith("ffprobe") and entry.is_file()
+            }
+    except OSError:
+        return None
+
+    for candidate in candidates:
+        if candidate in siblings:
+            return siblings[candidate]
 
     return None
 
 
+@functools.cache
+def resolve_binaries() -> tuple[str, str | None]:
+    ffmpeg_binary = resolve_ffmpeg_binary()
+    return ffmpeg_binary, resolve_ffprobe_binary(ffmpeg_binary)
+
+
+@functools.cache
+def list_ffmpeg_encoders(ffmpeg_binary: str) -> frozenset[str]:
+    cmd = [ffmpeg_binary, "-hide_banner", "-encoders"]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    encoders = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0].startswith("V"):
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+
+def video_encoder_works(ffmpeg_binary: str, video_encoder: str) -> bool:
+    cmd = [
+        ffmpeg_binary,
+        "-hide_banner",
+        "-v",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=c=black:s=256x256:d=0.1",
+        "-frames:v",
+        "1",
+        "-c:v",
+        video_encoder,
+        *VIDEO_ENCODER_ARGS[video_encoder],
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=False, timeout=15)
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0
+
+
+@functools.cache
+def select_video_encoder(ffmpeg_binary: str) -> str:
+    available = list_ffmpeg_encoders(ffmpeg_binary)
+    preference = HARDWARE_ENCODER_PREFERENCE.get(
+        sys.platform, HARDWARE_ENCODER_PREFERENCE["default"]
+    )
+    for video_encoder in preference:
+        if video_encoder in available and video_encoder_works(ffmpeg_binary, video_encoder):
+            return video_encoder
+    return "libx264"
+
+
 def parse_duration_from_ffmpeg_probe_output(output: str) -> float | None:
-    match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", output)
+    match = _DURATION_RE.search(output)
     if not match:
         return None
 
@@ -111,44 +237,240 @@ def parse_duration_from_ffmpeg_probe_output(output: str) -> float | None:
     return duration if duration > 0 else None
 
 
-def get_video_duration_seconds(
+def parse_audio_from_ffmpeg_probe_output(output: str) -> bool:
+    return _AUDIO_STREAM_RE.search(output) is not None
+
+
+def is_quarter_turn(rotation: float) -> bool:
+    return round(rotation) % 180 == 90
+
+
+def parse_video_size_from_ffmpeg_probe_output(output: str) -> tuple[int | None, int | None]:
+    match = _VIDEO_SIZE_RE.search(output)
+    if not match:
+        return None, None
+
+    width, height = int(match.group(1)), int(match.group(2))
+    rotation_match = _ROTATION_RE.search(output, match.end())
+    if rotation_match and is_quarter_turn(float(rotation_match.group(1))):
+        width, height = height, width
+    return width, height
+
+
+def probe_video_with_ffprobe(
+    video_path: Path,
+    ffprobe_binary: str,
+) -> tuple[float | None, bool, int | None, int | None] | None:
+    cmd = [
+        ffprobe_binary,
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration:stream=codec_type,width,height:stream_side_data=rotation:stream_tags=rotate",
+        "-of",
+        "flat",
+        str(video_path),
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return None
+
+    duration: float | None = None
+    streams_by_index: dict[str, dict[str, str]] = {}
+    for line in result.stdout.splitlines():
+        key, separator, value = line.partition("=")
+        if not separator:
+            continue
+        value = value.strip('"')
+        if key == "format.duration":
+            try:
+                duration = float(value)
+            except ValueError:
+                duration = None
+        elif key.startswith("streams.stream."):
+            _, _, index, field = key.split(".", 3)
+            streams_by_index.setdefault(index, {})[field] = value
+
+    streams = list(streams_by_index.values())
+    has_audio = any(stream.get("codec_type") == "audio" for stream in streams)
+
+    width: int | None = None
+    height: int | None = None
+    for stream in streams:
+        if stream.get("codec_type") != "video":
+            continue
+        if stream.get("width", "").isdigit() and stream.get("height", "").isdigit():
+            width, height = int(stream["width"]), int(stream["height"])
+            if width > 0 and height > 0:
+                rotations = [
+                    value
+                    for field, value in stream.items()
+                    if field.endswith(".rotation") or field == "tags.rotate"
+                ]
+                try:
+                    if rotations and is_quarter_turn(float(rotations[0])):
+                        width, height = height, width
+                except ValueError:
+                    pass
+                break
+            width = height = None
+
+    return duration, has_audio, width, height
+
+
+def probe_video_with_ffmpeg(
+    video_path: Path,
+    ffmpeg_binary: str,
+) -> tuple[float | None, bool, int | None, int | None]:
+    cmd = [ffmpeg_binary, "-hide_banner", "-i", str(video_path)]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
+    output = result.stderr
+
+    header = output[:FFMPEG_PROBE_OUTPUT_LIMIT].decode("utf-8", errors="replace")
+    duration = parse_duration_from_ffmpeg_probe_output(header)
+    if duration is None and len(output) > FFMPEG_PROBE_OUTPUT_LIMIT:
+        duration = parse_duration_from_ffmpeg_probe_output(output.decode("utf-8", errors="replace"))
+
+    streams_start = output.find(b"Stream #")
+    streams = output[streams_start:].decode("utf-8", errors="replace") if streams_start >= 0 else ""
+    return (
+        duration,
+        parse_audio_from_ffmpeg_probe_output(streams),
+        *parse_video_size_from_ffmpeg_probe_output(streams),
+    )
+
+
+def get_probe_cache_path() -> Path:
+    try:
+        import appdirs  # type: ignore
+
+        cache_dir = Path(appdirs.user_cache_dir("video-editor"))
+    except Exception:  # noqa: BLE001
+        cache_dir = Path.home() / ".cache" / "video-editor"
+    return cache_dir / "probe.json"
+
+
+def read_probe_cache_file(cache_path: Path) -> dict[str, list]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if isinstance(payload, dict) and payload.get("version") == PROBE_CACHE_VERSION:
+        entries = payload.get("entries", {})
+        if isinstance(entries, dict):
+            return entries
+    return {}
+
+
+def load_probe_cache() -> dict[str, list]:
+    global _probe_cache
+
+    if _probe_cache is None:
+        _probe_cache = read_probe_cache_file(get_probe_cache_path())
+
+    return _probe_cache
+
+
+@contextlib.contextmanager
+def probe_cache_lock(cache_path: Path) -> Iterator[None]:
+    lock_path = cache_path.with_name(f"{cache_path.name}.lock")
+    with open(lock_path, "a+b") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def save_probe_cache(entries: dict[str, list]) -> None:
+    cache_path = get_probe_cache_path()
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with probe_cache_lock(cache_path):
+            merged = read_probe_cache_file(cache_path)
+            merged.update(entries)
+            tmp_path.write_text(
+                json.dumps({"version": PROBE_CACHE_VERSION, "entries": merged}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, cache_path)
+        entries.update(merged)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def cached_probe(probe: Callable[..., tuple]) -> Callable[..., tuple]:
+    @functools.wraps(probe)
+    def wrapper(
+        video_path: Path,
+        *args: object,
+        video_stat: os.stat_result | None = None,
+    ) -> tuple:
+        st = video_stat if video_stat is not None else video_path.stat()
+        key = json.dumps([str(video_path.absolute()), st.st_mtime_ns, st.st_size])
+
+        entries = load_probe_cache()
+        cached = entries.get(key)
+        if cached is not None:
+            return tuple(cached)
+
+        result = probe(video_path, *args)
+        entries[key] = list(result)
+        save_probe_cache(entries)
+        return result
+
+    return wrapper
+
+
+@cached_probe
+def probe_video(
     video_path: Path,
     ffmpeg_binary: str,
     ffprobe_binary: str | None,
-) -> float:
-    duration: float | None = None
+) -> tuple[float, bool, int, int]:
+    probe: tuple[float | None, bool, int | None, int | None] | None = None
 
     if ffprobe_binary:
-        cmd = [
-            ffprobe_binary,
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "json",
-            str(video_path),
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if result.returncode == 0:
-            payload = json.loads(result.stdout or "{}")
-            duration_raw = payload.get("format", {}).get("duration")
-            if duration_raw is not None:
-                duration = float(duration_raw)
+        probe = probe_video_with_ffprobe(video_path, ffprobe_binary)
 
-    if duration is None:
-        fallback_cmd = [ffmpeg_binary, "-i", str(video_path)]
-        fallback_result = subprocess.run(fallback_cmd, capture_output=True, text=True, check=False)
-        combined_output = f"{fallback_result.stdout}\n{fallback_result.stderr}"
-        duration = parse_duration_from_ffmpeg_probe_output(combined_output)
+    if probe is None:
+        duration, has_audio, width, height = probe_video_with_ffmpeg(video_path, ffmpeg_binary)
+    else:
+        duration, has_audio, width, height = probe
+        if duration is None or width is None or height is None:
+            fallback_duration, _, fallback_width, fallback_height = probe_video_with_ffmpeg(
+                video_path, ffmpeg_binary
+            )
+            if duration is None:
+                duration = fallback_duration
+            if width is None or height is None:
+                width, height = fallback_width, fallback_height
 
     if duration is None or duration <= 0:
         raise RuntimeError(
             "Não foi possível obter a duração do vídeo. Verifique se o ficheiro não está corrompido."
         )
+    if width is None or height is None:
+        raise RuntimeError(
+            "Não foi possível obter a resolução do vídeo. Verifique se o ficheiro não está corrompido."
+        )
 
-    return duration
+    return duration, has_audio, width, height
 
 
 def compute_trim_window(video_duration_seconds: float) -> tuple[float, float]:
@@ -170,70 +492,142 @@ def build_ffmpeg_command(
     ffmpeg_binary: str,
     input_video: Path,
     logo: Path,
+    logo_size: tuple[int, int] | None,
     output_video: Path,
     include_audio: bool,
+    video_encoder: str,
+    video_width: int,
+    video_height: int,
     start_second: float,
     end_second: float,
-) -> list[str]:
-    crop_width_expr = f"iw/{ZOOM_FACTOR}"
-    crop_height_expr = f"ih/{ZOOM_FACTOR}"
-
-    video_chain = (
-        f"[0:v]scale=iw*{ZOOM_FACTOR}:ih*{ZOOM_FACTOR},"
-        f"[0:v]trim=start={start_second}:end={end_second},"
-        "setpts=PTS-STARTPTS,"
-        f"scale=iw*{ZOOM_FACTOR}:ih*{ZOOM_FACTOR},"
-        f"crop={crop_width_expr}:{crop_height_expr}:(in_w-out_w)/2:(in_h-out_h)/2[base];"
-        f"[1:v][base]scale2ref=w=main_w*{WATERMARK_WIDTH_RATIO}:h=-1[wm][base2];"
-        f"[base2][wm]overlay=W-w-{PADDING_PX}:H-h-{PADDING_PX}[vout]"
-    )
+    threads: int | None = None,
+) -> tuple[list[str], Path]:
+    crop_width = int(video_width / ZOOM_FACTOR)
+    crop_height = int(video_height / ZOOM_FACTOR)
+    logo_width = int(video_width * WATERMARK_WIDTH_RATIO)
+
+    filter_parts = [
+        f"[1:v]scale={logo_width}:-1[wm]",
+        (
+            f"[0:v]crop={crop_width}:{crop_height}:(in_w-out_w)/2:(in_h-out_h)/2,"
+            f"scale={video_width}:{video_height},setsar=1[base]"
+        ),
+        f"[base][wm]overlay=W-w-{PADDING_PX}:H-h-{PADDING_PX}:repeatlast=1:shortest=0[vout]",
+    ]
 
-    filter_complex = video_chain
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        suffix=".txt",
+        prefix="video-editor-filter-",
+        delete=False,
+        encoding="utf-8",
+    ) as filter_script:
+        filter_script.write(";".join(filter_parts))
 
     command = [
         ffmpeg_binary,
         "-y",
         "-ss",
         f"{start_second:.3f}",
-        "-to",
-        f"{end_second:.3f}",
+        "-t",
+        f"{end_second - start_second:.3f}",
         "-i",
         str(input_video),
-        "-loop",
-        "1",
-        "-i",
-        str(logo),
     ]
 
-    if include_audio:
-        filter_complex = f"{video_chain};[0:a]asetpts=PTS-STARTPTS[aout]"
-        audio_chain = (
-            f"[0:a]atrim=start={start_second}:end={end_second},"
-            "asetpts=PTS-STARTPTS[aout]"
-        )
-        filter_complex = f"{video_chain};{audio_chain}"
+    if logo_size is not None:
+        logo_width_px, logo_height_px = logo_size
+        command += [
+            "-f",
+            "rawvideo",
+            "-pixel_format",
+            "rgba",
+            "-video_size",
+            f"{logo_width_px}x{logo_height_px}",
+            "-framerate",
+            "1",
+            "-i",
+            "pipe:0",
+        ]
+    else:
+        command += ["-i", str(logo)]
 
     command += [
-        "-filter_complex",
-        filter_complex,
+        "-filter_complex_script",
+        filter_script.name,
         "-map",
         "[vout]",
     ]
 
     if include_audio:
-        command += ["-map", "[aout]", "-c:a", "aac"]
+        command += ["-map", "0:a:0", "-c:a", "aac"]
 
     command += [
         "-c:v",
-        "libx264",
-        "-pix_fmt",
-        "yuv420p",
+        video_encoder,
+        *VIDEO_ENCODER_ARGS[video_encoder],
+    ]
+
+    if threads is not None:
+        command += ["-threads", str(threads)]
+
+    command += [
         "-shortest",
         "-movflags",
         "+faststart",
+        "-progress",
+        "pipe:2",
+        "-nostats",
         str(output_video),
     ]
-    return command
+    return command, Path(filter_script.name)
+
+
+async def run_ffmpeg(
+    cmd: list[str],
+    on_progress: Callable[[float], None] | None = None,
+    stdin_data: bytes | None = None,
+) -> int:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL if stdin_data is None else asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        limit=FFMPEG_PIPE_BUFFER_SIZE,
+    )
+    assert proc.stderr is not None
+
+    async def feed_stdin() -> None:
+        assert proc.stdin is not None
+        try:
+            proc.stdin.write(stdin_data or b"")
+            await proc.stdin.drain()
+            proc.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    feeder = asyncio.create_task(feed_stdin()) if stdin_data is not None else None
+
+    stderr_tail: deque[str] = deque(maxlen=50)
+
+    async for raw_line in proc.stderr:
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        match = _PROGRESS_LINE_RE.match(line)
+        if match is None:
+            if line:
+                stderr_tail.append(line)
+            continue
+
+        key, value = match.groups()
+        if key == "out_time_us" and value.isdigit() and on_progress is not None:
+            on_progress(int(value) / 1_000_000)
+
+    if feeder is not None:
+        await feeder
+    returncode = await proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr="\n".join(stderr_tail))
+    return returncode
 
 
 def ensure_output_path(output_video: Path) -> None:
@@ -244,7 +638,22 @@ def ensure_output_path(output_video: Path) -> None:
     output_parent.mkdir(parents=True, exist_ok=True)
 
 
+def ensure_distinct_paths(input_video: Path, input_stat: os.stat_result, output_video: Path) -> None:
+    same_file = input_video == output_video
+    if not same_file:
+        try:
+            same_file = os.path.samestat(input_stat, output_video.stat())
+        except FileNotFoundError:
+            pass
+
+    if same_file:
+        raise ValueError(f"O ficheiro de saída não pode ser o próprio vídeo de entrada: {input_video}")
+
+
 def collect_paths_gui(default_output: str) -> tuple[str, str, str] | None:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+
     selections: dict[str, str] = {}
 
     root = tk.Tk()
@@ -318,11 +727,366 @@ def collect_paths_gui(default_output: str) -> tuple[str, str, str] | None:
     return selections["input"], selections["logo"], selections["output"]
 
 
-def resolve_paths(args: argparse.Namespace) -> tuple[Path, Path, Path] | None:
-    wants_gui = args.gui or not args.input or not args.logo
+def collect_paths_dialogs(default_output: str) -> tuple[str, str, str] | None:
+    import tkinter as tk
+    from tkinter import filedialog
+
+    root = tk.Tk()
+    root.withdraw()
+
+    try:
+        input_path = filedialog.askopenfilename(
+            title="Selecionar vídeo",
+            filetypes=[("Vídeo MP4", "*.mp4")],
+        )
+        if not input_path:
+            return None
+
+        logo_path = filedialog.askopenfilename(
+            title="Selecionar logo",
+            filetypes=[("Imagem PNG", "*.png")],
+        )
+        if not logo_path:
+            return None
+
+        output_path = filedialog.asksaveasfilename(
+            title="Guardar vídeo editado",
+            defaultextension=".mp4",
+            filetypes=[("Vídeo MP4", "*.mp4")],
+            initialfile=Path(default_output).name,
+        )
+        if not output_path:
+            return None
+    finally:
+        root.destroy()
+
+    return input_path, logo_path, output_path
+
+
+def run_ffmpeg_with_progress_gui(
+    cmd: list[str],
+    clip_duration: float,
+    stdin_data: bytes | None = None,
+) -> None:
+    import tkinter as tk
+    from tkinter import ttk
+
+    print("Executando:", " ".join(cmd))
+    events: queue.Queue[tuple[str, object]] = queue.Queue()
+    outcome: dict[str, BaseException] = {}
+
+    def worker() -> None:
+        try:
+            asyncio.run(
+                run_ffmpeg(
+                    cmd,
+                    on_progress=lambda seconds: events.put(("progress", seconds)),
+                    stdin_data=stdin_data,
+                )
+            )
+            events.put(("done", None))
+        except BaseException as exc:  # noqa: BLE001
+            events.put(("error", exc))
+
+    root = tk.Tk()
+    root.title("Video Editor")
+    root.geometry("420x110")
+    root.resizable(False, False)
+    root.protocol("WM_DELETE_WINDOW", lambda: None)
+
+    status_var = tk.StringVar(value="A processar vídeo...")
+    tk.Label(root, textvariable=status_var, anchor="w").pack(fill="x", padx=16, pady=(18, 8))
+    progressbar = ttk.Progressbar(root, maximum=100, length=388, mode="determinate")
+    progressbar.pack(padx=16)
+
+    def poll_subprocess() -> None:
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                percent = min(100.0, 100.0 * float(payload) / clip_duration)
+                progressbar["value"] = percent
+                status_var.set(f"A processar vídeo... {percent:.0f}%")
+            else:
+                if kind == "error":
+                    outcome["error"] = payload  # type: ignore[assignment]
+                root.destroy()
+                return
+        root.after(100, poll_subprocess)
+
+    threading.Thread(target=worker, daemon=True).start()
+    root.after(100, poll_subprocess)
+    root.mainloop()
+
+    if "error" in outcome:
+        raise outcome["error"]
+
+
+def print_progress(seconds: float, clip_duration: float) -> None:
+    percent = min(100.0, 100.0 * seconds / clip_duration)
+    print(f"\r⏳ {percent:5.1f}%", end="", flush=True)
+
+
+def run_ffmpeg_with_progress_cli(
+    cmd: list[str],
+    clip_duration: float,
+    stdin_data: bytes | None = None,
+) -> None:
+    print("Executando:", " ".join(cmd))
+    try:
+        asyncio.run(
+            run_ffmpeg(
+                cmd,
+                on_progress=lambda seconds: print_progress(seconds, clip_duration),
+                stdin_data=stdin_data,
+            )
+        )
+    finally:
+        print()
+
+
+def run_ffmpeg_quiet(
+    cmd: list[str],
+    clip_duration: float,
+    stdin_data: bytes | None = None,
+) -> None:
+    asyncio.run(run_ffmpeg(cmd, stdin_data=stdin_data))
+
+
+def prepare_logo(logo: Path) -> tuple[bytes, int, int] | None:
+    validate_input_file(logo, SUPPORTED_IMAGE_EXTENSIONS, "Logo")
+
+    try:
+        from PIL import Image  # type: ignore
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(logo) as image:
+            rgba = image.convert("RGBA")
+    except Exception as exc:  # noqa: BLE001
+        raise ValueError(f"Logo inválido: {exc}") from exc
+    return rgba.tobytes(), rgba.width, rgba.height
+
+
+def validate_job_paths(input_video: Path, output_video: Path) -> os.stat_result:
+    input_stat = validate_input_file(input_video, SUPPORTED_VIDEO_EXTENSIONS, "Vídeo de entrada")
+    ensure_distinct_paths(input_video, input_stat, output_video)
+    ensure_output_path(output_video)
+    return input_stat
 
-    if wants_gui:
-        gui_result = collect_paths_gui(args.output)
+
+def process_one(
+    input_video: Path,
+    logo: Path,
+    output_video: Path,
+    ffmpeg_binary: str,
+    ffprobe_binary: str | None,
+    video_encoder: str,
+    logo_pixels: tuple[bytes, int, int] | None = None,
+    run_encode: Callable[[list[str], float, bytes | None], None] = run_ffmpeg_quiet,
+    threads: int | None = None,
+    input_stat: os.stat_result | None = None,
+) -> bool:
+    if input_stat is None:
+        input_stat = validate_job_paths(input_video, output_video)
+
+    video_duration, include_audio, video_width, video_height = probe_video(
+        input_video, ffmpeg_binary, ffprobe_binary, video_stat=input_stat
+    )
+    start_second, end_second = compute_trim_window(video_duration)
+
+    ffmpeg_cmd, filter_script = build_ffmpeg_command(
+        ffmpeg_binary,
+        input_video,
+        logo,
+        logo_pixels[1:] if logo_pixels is not None else None,
+        output_video,
+        include_audio,
+        video_encoder,
+        video_width,
+        video_height,
+        start_second,
+        end_second,
+        threads,
+    )
+    try:
+        run_encode(
+            ffmpeg_cmd,
+            end_second - start_second,
+            logo_pixels[0] if logo_pixels is not None else None,
+        )
+    finally:
+        filter_script.unlink(missing_ok=True)
+
+    return include_audio
+
+
+def collect_batch_inputs(input_dir: Path) -> list[Path]:
+    try:
+        with os.scandir(input_dir) as entries:
+            inputs = sorted(
+                input_dir / entry.name
+                for entry in entries
+                if Path(entry.name).suffix.lower() in SUPPORTED_VIDEO_EXTENSIONS
+                and not Path(entry.name).stem.endswith("_edited")
+                and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Pasta de entrada não encontrada: {input_dir}") from None
+
+    if not inputs:
+        allowed = ", ".join(sorted(SUPPORTED_VIDEO_EXTENSIONS))
+        raise FileNotFoundError(f"Nenhum vídeo ({allowed}) encontrado em: {input_dir}")
+    return inputs
+
+
+def pin_batch_worker(
+    slot_counter: multiprocessing.sharedctypes.Synchronized,
+    cpu_ids: list[int],
+    threads_per_job: int,
+) -> None:
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+
+    first = (slot * threads_per_job) % len(cpu_ids)
+    cores = {cpu_ids[(first + offset) % len(cpu_ids)] for offset in range(threads_per_job)}
+    os.sched_setaffinity(0, cores)
+
+
+def init_batch_worker(
+    logo_pixels: tuple[bytes, int, int] | None,
+    pinning: tuple[multiprocessing.sharedctypes.Synchronized, list[int], int] | None,
+) -> None:
+    global _batch_logo_pixels
+
+    _batch_logo_pixels = logo_pixels
+    if pinning is not None:
+        pin_batch_worker(*pinning)
+
+
+def process_batch_item(
+    input_video: Path,
+    logo: Path,
+    output_video: Path,
+    ffmpeg_binary: str,
+    ffprobe_binary: str | None,
+    video_encoder: str,
+    threads: int,
+) -> bool:
+    return process_one(
+        input_video,
+        logo,
+        output_video,
+        ffmpeg_binary,
+        ffprobe_binary,
+        video_encoder,
+        _batch_logo_pixels,
+        threads=threads,
+    )
+
+
+def describe_error(exc: BaseException) -> str:
+    if isinstance(exc, subprocess.CalledProcessError):
+        message = f"Falha ao processar vídeo. Código: {exc.returncode}"
+        if exc.stderr:
+            stderr_lines = str(exc.stderr).splitlines()[-BATCH_ERROR_TAIL_LINES:]
+            message += "\n" + "\n".join(f"    {line}" for line in stderr_lines)
+        return message
+    return str(exc)
+
+
+def run_batch(
+    args: argparse.Namespace,
+    ffmpeg_binary: str,
+    ffprobe_binary: str | None,
+) -> int:
+    if not args.logo:
+        raise ValueError("--logo é obrigatório com --input-dir")
+
+    input_dir = Path(args.input_dir).expanduser().resolve()
+    logo = Path(args.logo).expanduser().resolve()
+    inputs = collect_batch_inputs(input_dir)
+    logo_pixels = prepare_logo(logo)
+    video_encoder = select_video_encoder(ffmpeg_binary)
+
+    if video_encoder == "libx264":
+        max_jobs = max(1, (os.cpu_count() or 2) // 2)
+    else:
+        max_jobs = MAX_HARDWARE_ENCODER_JOBS
+    jobs = max(1, min(args.jobs, max_jobs, len(inputs)))
+    threads_per_job = args.threads_per_job
+    if threads_per_job is None:
+        threads_per_job = max(1, (os.cpu_count() or 1) // jobs)
+    print(
+        f"A processar {len(inputs)} vídeo(s) com {jobs} job(s) em paralelo "
+        f"({video_encoder}, {threads_per_job} thread(s) por job)."
+    )
+
+    pinning = None
+    if args.pin_cores:
+        if hasattr(os, "sched_setaffinity"):
+            pinning = (
+                multiprocessing.Value("i", 0),
+                sorted(os.sched_getaffinity(0)),
+                threads_per_job,
+            )
+        else:
+            print("⚠️ --pin-cores não é suportado nesta plataforma; a ignorar.")
+
+    failures = 0
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_batch_worker,
+        initargs=(logo_pixels, pinning),
+    ) as executor:
+        futures = {
+            executor.submit(
+                process_batch_item,
+                input_video,
+                logo,
+                input_dir / f"{input_video.stem}_edited.mp4",
+                ffmpeg_binary,
+                ffprobe_binary,
+                video_encoder,
+                threads_per_job,
+            ): input_video
+            for input_video in inputs
+        }
+
+        completed = as_completed(futures)
+        try:
+            from tqdm import tqdm  # type: ignore
+
+            completed = tqdm(completed, total=len(futures), unit="vídeo")
+        except ImportError:
+            pass
+
+        for future in completed:
+            input_video = futures[future]
+            try:
+                future.result()
+            except Exception as exc:  # noqa: BLE001
+                failures += 1
+                print(f"❌ {input_video.name}: {describe_error(exc)}", file=sys.stderr)
+
+    print(f"✅ {len(inputs) - failures}/{len(inputs)} vídeo(s) editados em: {input_dir}")
+    return 0 if failures == 0 else 1
+
+
+def wants_gui(args: argparse.Namespace) -> bool:
+    return args.gui or args.gui_minimal or not args.input or not args.logo
+
+
+def resolve_paths(args: argparse.Namespace) -> tuple[Path, Path, Path] | None:
+    if wants_gui(args):
+        if args.gui_minimal:
+            gui_result = collect_paths_dialogs(args.output)
+        else:
+            gui_result = collect_paths_gui(args.output)
         if gui_result is None:
             return None
         input_path, logo_path, output_path = gui_result
@@ -342,38 +1106,37 @@ def main() -> int:
     args = parse_args()
 
     try:
-        paths = resolve_paths(args)
-        if paths is None:
-            print("Operação cancelada pelo utilizador.")
-            return 1
-
-        input_video, logo, output_video = paths
-
-        ffmpeg_binary = resolve_ffmpeg_binary()
-        ffprobe_binary = resolve_ffprobe_binary(ffmpeg_binary)
+        paths: tuple[Path, Path, Path] | None = None
+        if not args.input_dir:
+            paths = resolve_paths(args)
+            if paths is None:
+                print("Operação cancelada pelo utilizador.")
+                return 1
+
+        ffmpeg_binary, ffprobe_binary = resolve_binaries()
         if ffprobe_binary is None:
-            print("⚠️ ffprobe não encontrado; a usar fallback de duração via ffmpeg.")
-        validate_input_file(input_video, SUPPORTED_VIDEO_EXTENSIONS, "Vídeo de entrada")
-        validate_input_file(logo, SUPPORTED_IMAGE_EXTENSIONS, "Logo")
-        ensure_output_path(output_video)
+            print("⚠️ ffprobe não encontrado; a usar fallback de análise via ffmpeg.")
 
-        video_duration = get_video_duration_seconds(input_video, ffmpeg_binary, ffprobe_binary)
-        start_second, end_second = compute_trim_window(video_duration)
+        if paths is None:
+            return run_batch(args, ffmpeg_binary, ffprobe_binary)
 
-        include_audio = has_audio_stream(input_video, ffmpeg_binary)
-        ffmpeg_cmd = build_ffmpeg_command(
-            ffmpeg_binary,
+        input_video, logo, output_video = paths
+        input_stat = validate_job_paths(input_video, output_video)
+        logo_pixels = prepare_logo(logo)
+        video_encoder = select_video_encoder(ffmpeg_binary)
+        run_encode = run_ffmpeg_with_progress_gui if wants_gui(args) else run_ffmpeg_with_progress_cli
+        include_audio = process_one(
             input_video,
             logo,
             output_video,
-            include_audio,
-            start_second,
-            end_second,
+            ffmpeg_binary,
+            ffprobe_binary,
+            video_encoder,
+            logo_pixels,
+            run_encode,
+            input_stat=input_stat,
         )
 
-        print("Executando:", " ".join(ffmpeg_cmd))
-        subprocess.run(ffmpeg_cmd, check=True)
-
         if include_audio:
             print(f"✅ Vídeo editado gerado com áudio em: {output_video}")
         else: